@@ -1,11 +1,44 @@
 import os
+import atexit
+import functools
 import hashlib
-from datetime import datetime
-from typing import List, Dict, Any, Optional
+import heapq
+import json
+import logging
+import queue
+import re
+import secrets
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import List, Dict, Any, Iterator, Optional, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from dotenv import load_dotenv
-from flask import Flask, render_template
+from flask import Flask, Response, render_template
+
+try:
+    # Optional: faster JSON decoding of provider payloads
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    # Optional: streaming JSON parsing for large provider payloads
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    # Optional: shared job cache across worker processes (see REDIS_URL)
+    import redis
+except ImportError:
+    redis = None
 
 
 # Load environment variables from .env (API keys, config, etc.)
@@ -14,15 +47,81 @@ load_dotenv()
 app = Flask(__name__)
 
 
+# Application logger. Records are handed to a queue and written out by a
+# background listener thread, so request and fetch threads never block on
+# stdout. Set LOG_LEVEL=DEBUG to see per-provider details.
+class _ProcessQueueHandler(QueueHandler):
+    """
+    QueueHandler that starts its listener thread on first use in each process.
+
+    Threads do not survive fork(), so a listener started at import time would
+    be missing in workers forked from a preloaded app (gunicorn --preload) and
+    their records would pile up unwritten. Starting it lazily, and again when
+    the PID changes, gives every process its own listener.
+    """
+
+    def __init__(self, target: logging.Handler) -> None:
+        super().__init__(queue.Queue(-1))
+        self.target = target
+        self.listener: Optional[QueueListener] = None
+        self._pid: Optional[int] = None
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        # Called under the handler lock, which logging resets after fork
+        if self._pid != os.getpid():
+            self._start_listener()
+        super().enqueue(record)
+
+    def _start_listener(self) -> None:
+        # A forked child inherits the parent's queue, so start from a fresh one
+        self.queue = queue.Queue(-1)
+        self.listener = QueueListener(self.queue, self.target)
+        self.listener.start()
+        atexit.register(self.listener.stop)
+        self._pid = os.getpid()
+
+
+def _resolve_log_level(value: str) -> int:
+    """Return the logging level named by value, or INFO if it is not one."""
+    level = logging.getLevelName(value.strip().upper())
+    if isinstance(level, int):
+        return level
+    logger.warning("Unknown LOG_LEVEL %r, using INFO", value)
+    return logging.INFO
+
+
+logger = logging.getLogger("aggregator")
+logger.propagate = False
+logger.addHandler(_ProcessQueueHandler(logging.StreamHandler()))
+logger.setLevel(_resolve_log_level(os.getenv("LOG_LEVEL", "INFO")))
+
+
+# Shared HTTP session for all providers. Pooling keeps TCP/TLS connections
+# alive between fetches and page loads, and transient gateway errors are
+# retried a couple of times before a provider is given up on.
+SESSION = requests.Session()
+SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=16,
+        max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[502, 503, 504]),
+    ),
+)
+
+
 # ---------------------------------------------------------------------------
 # Standard Internal Job Format
 # ---------------------------------------------------------------------------
 #
-# All job data from every API must be normalized into this exact Python
-# dictionary structure. This unified format allows the rest of the application
-# to work with heterogeneous APIs without needing provider-specific logic.
+# All job data from every API must be normalized into this exact structure.
+# This unified format allows the rest of the application to work with
+# heterogeneous APIs without needing provider-specific logic.
 #
-# Format:
+# Jobs are stored as slotted, frozen dataclass instances rather than dicts to
+# keep per-record memory low during aggregation, dedup, and sorting. Templates
+# read them with the same attribute syntax (job.title), and Job.to_dict()
+# returns the plain dictionary form:
 # {
 #   "id": "unique_job_id",
 #   "title": "Job Title",
@@ -30,16 +129,74 @@ app = Flask(__name__)
 #   "location": "Location or Remote",
 #   "url": "Original job application link",
 #   "category": "Software Engineering | Data Science | AI/ML | Internship",
+#   "category_slug": "software-engineering | data-science | ai-ml | internship",
 #   "source": "API name",
 #   "published": "ISO date string or empty"
 # }
 
 
+@dataclass(slots=True, frozen=True)
+class Job:
+    """
+    A single normalized job listing.
+
+    published_dt and dedup_key are computed once at ingestion for sorting and
+    deduplication; they are not part of the public format.
+    """
+
+    id: str
+    title: str
+    company: str
+    location: str
+    url: str
+    category: str
+    category_slug: str
+    source: str
+    published: str
+    published_dt: Optional[datetime] = field(default=None, compare=False, repr=False)
+    dedup_key: Tuple[str, str] = field(default=("", ""), compare=False, repr=False)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the job in the standard internal dictionary format."""
+        return {
+            "id": self.id,
+            "title": self.title,
+            "company": self.company,
+            "location": self.location,
+            "url": self.url,
+            "category": self.category,
+            "category_slug": self.category_slug,
+            "source": self.source,
+            "published": self.published,
+        }
+
+
 # ---------------------------------------------------------------------------
 # Categorization and Utility Helpers
 # ---------------------------------------------------------------------------
 
 
+# All categorization keywords compiled into one whole-word alternation, so each
+# title is scanned once ("ai" must not match "detail", "ml" must not match
+# "html", "intern" must not match "internal"). Each named group maps to a
+# category; _CAT_GROUPS lists them in priority order.
+_CAT_RE = re.compile(
+    r"\b(?:"
+    r"(?P<intern>interns?|internships?)"
+    r"|(?P<data>data|databases?|analysts?)"
+    r"|(?P<ai>ai|ml|mlops|genai|llms?|nlp|machine[\s_-]+learning)"
+    r")\b",
+    re.IGNORECASE,
+)
+
+_CAT_GROUPS = (
+    ("intern", "Internship"),
+    ("data", "Data Science"),
+    ("ai", "AI/ML"),
+)
+_CAT_RANK = {group: rank for rank, (group, _) in enumerate(_CAT_GROUPS)}
+
+
 def categorize_job(title: str) -> str:
     """
     Categorize a job title into a high-level bucket using keyword matching.
@@ -48,67 +205,219 @@ def categorize_job(title: str) -> str:
     regardless of how each provider structures their job data.
 
     Order matters: a "Data Science Intern" should be marked as Internship,
-    not Data Science, so we check for internships first.
+    not Data Science, so the highest-priority keyword found anywhere in the
+    title wins, not the leftmost one.
     """
-    t = title.lower()
+    best = len(_CAT_GROUPS)
+    for match in _CAT_RE.finditer(title):
+        best = min(best, _CAT_RANK[match.lastgroup])
+        if best == 0:
+            break
+
+    if best < len(_CAT_GROUPS):
+        return _CAT_GROUPS[best][1]
 
-    if "intern" in t or "internship" in t:
-        return "Internship"
+    return "Software Engineering"
 
-    if "data" in t or "analyst" in t:
-        return "Data Science"
 
-    if "ai" in t or "ml" in t or "machine learning" in t:
-        return "AI/ML"
+def _clean(*values: Optional[str], default: str = "") -> str:
+    """
+    Return the first non-blank value, stripped, or default if there is none.
 
-    return "Software Engineering"
+    Provider fields are stripped exactly once here so the results can be
+    reused for display, IDs, and deduplication.
+    """
+    for value in values:
+        if value:
+            stripped = value.strip()
+            if stripped:
+                return stripped
+    return default
+
+
+# Precomputed CSS slugs for every category categorize_job can return
+_SLUG = {
+    "Internship": "internship",
+    "Data Science": "data-science",
+    "AI/ML": "ai-ml",
+    "Software Engineering": "software-engineering",
+}
 
 
 def slug_for_category(category: str) -> str:
     """
     Generate a CSS-friendly slug from a category label.
 
+    Known categories are looked up in a static table; anything else is
+    slugified on the fly.
+
     Example:
     "AI/ML" -> "ai-ml"
     "Software Engineering" -> "software-engineering"
     """
-    return (
+    return _SLUG.get(category) or (
         category.lower()
         .replace("/", "-")
         .replace(" ", "-")
     )
 
 
+@functools.lru_cache(maxsize=4096)
 def generate_job_id(title: str, company: str, source: str) -> str:
     """
     Generate a unique job ID from title, company, and source.
 
-    This creates a stable identifier for deduplication purposes.
+    This creates a stable identifier for deduplication purposes. IDs are
+    16 hex characters from a 64-bit blake2b digest (stdlib, so the same
+    job gets the same ID in every environment).
+
+    title and company must already be stripped and lowercased (the fetch
+    functions pass their dedup key) so no normalization is repeated here.
     """
-    combined = f"{source}:{title}:{company}".lower().strip()
-    return hashlib.md5(combined.encode()).hexdigest()[:16]
+    combined = f"{source.lower()}:{title}:{company}"
+    return hashlib.blake2b(combined.encode(), digest_size=8).hexdigest()
 
 
-def parse_iso_datetime(value: Optional[str]) -> Optional[str]:
+def parse_iso_datetime(value: Optional[str]) -> Tuple[str, Optional[datetime]]:
     """
     Parse and normalize datetime strings to ISO format.
 
     Different APIs return dates in various formats. This function normalizes
     them to ISO 8601 strings (YYYY-MM-DDTHH:MM:SS) for consistent handling.
 
-    Returns empty string if parsing fails, as per the standard format spec.
+    Returns (iso_string, datetime) so callers can keep the parsed value for
+    sorting; the returned datetime is always timezone-aware (naive values are
+    assumed to be UTC) so mixed providers sort together. Returns ("", None) if
+    parsing fails, as per the standard format spec.
     """
     if not value:
-        return ""
+        return "", None
 
     try:
         # Handle common ISO variants
         dt_str = value.replace("Z", "+00:00")
         dt = datetime.fromisoformat(dt_str)
-        return dt.isoformat()
     except Exception:
         # If parsing fails, return empty string per spec
-        return ""
+        return "", None
+
+    iso = dt.isoformat()
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return iso, dt
+
+
+def decode_json(response: requests.Response) -> Any:
+    """
+    Decode a JSON response body.
+
+    Uses orjson straight from the raw bytes when it is installed, falling back
+    to the stdlib-backed response.json() otherwise.
+    """
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def iter_json_items(response: requests.Response, prefix: str) -> Iterator[Any]:
+    """
+    Stream the items of a JSON array out of a response opened with stream=True.
+
+    Items are parsed incrementally by ijson, so the full payload is never held
+    in memory at once. The response is closed once iteration finishes; parse
+    or network errors mid-stream propagate to the caller.
+    """
+    response.raw.decode_content = True
+    try:
+        yield from ijson.items(response.raw, prefix)
+    finally:
+        response.close()
+
+
+# Conditional request state per provider: the ETag / Last-Modified validators
+# of the last full response and the jobs normalized from it. A 304 reply to a
+# conditional request means the jobs can be reused without re-downloading or
+# re-parsing the payload.
+_PROVIDER_CACHE_META: Dict[str, Dict[str, Any]] = {}
+
+
+def conditional_headers(source: str) -> Dict[str, str]:
+    """
+    Return If-None-Match / If-Modified-Since headers for a provider's last
+    response, or an empty dict if there is nothing to revalidate.
+    """
+    meta = _PROVIDER_CACHE_META.get(source)
+    if not meta:
+        return {}
+
+    headers = {}
+    if meta["etag"]:
+        headers["If-None-Match"] = meta["etag"]
+    if meta["last_modified"]:
+        headers["If-Modified-Since"] = meta["last_modified"]
+    return headers
+
+
+def not_modified_jobs(source: str, response: requests.Response) -> Optional[List[Job]]:
+    """
+    Return the provider's previously normalized jobs if the response is a
+    304 Not Modified, otherwise None.
+    """
+    if response.status_code != 304:
+        return None
+
+    response.close()
+    meta = _PROVIDER_CACHE_META.get(source)
+    return meta["jobs"] if meta else []
+
+
+def remember_validators(source: str, response: requests.Response, jobs: List[Job]) -> None:
+    """
+    Store a provider response's cache validators with the jobs built from it.
+    """
+    etag = response.headers.get("ETag")
+    last_modified = response.headers.get("Last-Modified")
+    if jobs and (etag or last_modified):
+        _PROVIDER_CACHE_META[source] = {
+            "etag": etag,
+            "last_modified": last_modified,
+            "jobs": jobs,
+        }
+    else:
+        _PROVIDER_CACHE_META.pop(source, None)
+
+
+def _build_job(
+    title: str,
+    company: str,
+    location: str,
+    url: str,
+    source: str,
+    published_raw: Optional[str],
+) -> Job:
+    """
+    Build a Job from already-cleaned provider fields.
+
+    Shared by every provider so IDs, dedup keys, dates, and categories are
+    derived the same way regardless of source.
+    """
+    dedup_key = (title.lower(), company.lower())
+    published, published_dt = parse_iso_datetime(published_raw)
+    category = categorize_job(title)
+
+    return Job(
+        id=generate_job_id(*dedup_key, source),
+        title=title,
+        company=company,
+        location=location,
+        url=url,
+        category=category,
+        category_slug=slug_for_category(category),
+        source=source,
+        published=published,
+        published_dt=published_dt,
+        dedup_key=dedup_key,
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -130,7 +439,25 @@ def parse_iso_datetime(value: Optional[str]) -> Optional[str]:
 # - Data validation (skip incomplete entries)
 
 
-def fetch_remotive_jobs() -> List[Dict[str, Any]]:
+def _make_remotive_job(item: Dict[str, Any]) -> Optional[Job]:
+    """Normalize one Remotive result, or return None if it is incomplete."""
+    # Handle both dict and direct field access
+    if not isinstance(item, dict):
+        return None
+
+    title = _clean(item.get("title"))
+    company = _clean(item.get("company_name"), item.get("company"))
+    location = _clean(item.get("candidate_required_location"), item.get("location"), default="Remote")
+    url = _clean(item.get("url"), item.get("job_url"))
+
+    if not title or not company or not url:
+        return None
+
+    published_raw = item.get("publication_date") or item.get("published_at")
+    return _build_job(title, company, location, url, "Remotive", published_raw)
+
+
+def fetch_remotive_jobs() -> List[Job]:
     """
     Fetch remote-friendly tech jobs from the Remotive public API.
 
@@ -142,52 +469,61 @@ def fetch_remotive_jobs() -> List[Dict[str, Any]]:
     # Remotive API endpoint - no search params needed, returns all jobs
     url = "https://remotive.com/api/remote-jobs"
     
+    response = None
     try:
-        response = requests.get(url, timeout=10)
+        response = SESSION.get(url, headers=conditional_headers("Remotive"), stream=True, timeout=10)
         response.raise_for_status()
     except Exception as e:
-        # Log error for debugging (in production, use proper logging)
-        print(f"Remotive API error: {e}")
+        logger.warning("Remotive API error: %s", e)
+        if response is not None:
+            # Streamed responses hold their connection until closed
+            response.close()
+        return []
+
+    cached = not_modified_jobs("Remotive", response)
+    if cached is not None:
+        logger.debug("Remotive: Not modified, reusing %d jobs", len(cached))
+        return cached
+
+    # Remotive returns its jobs under a top-level 'jobs' key
+    if ijson is not None:
+        # The full dataset is large, so stream the jobs instead of
+        # materializing the whole payload first
+        items = iter_json_items(response, "jobs.item")
+    else:
+        payload = decode_json(response)
+        items = (payload.get("jobs") if isinstance(payload, dict) else None) or []
+
+    try:
+        jobs: List[Job] = [
+            job for item in items
+            if (job := _make_remotive_job(item)) is not None
+        ]
+    except Exception as e:
+        logger.warning("Remotive stream error: %s", str(e)[:100])
         return []
 
-    payload = response.json()
-    # Remotive returns jobs directly in the response, or in a 'jobs' key
-    items = payload.get("jobs", []) or (payload if isinstance(payload, list) else [])
-
-    jobs: List[Dict[str, Any]] = []
-    for item in items:
-        # Handle both dict and direct field access
-        if not isinstance(item, dict):
-            continue
-            
-        title = (item.get("title") or "").strip()
-        company = (item.get("company_name") or item.get("company") or "").strip()
-        location = (item.get("candidate_required_location") or item.get("location") or "Remote").strip()
-        url = (item.get("url") or item.get("job_url") or "").strip()
-
-        if not title or not company or not url:
-            continue
-
-        job_id = generate_job_id(title, company, "Remotive")
-        published = parse_iso_datetime(item.get("publication_date") or item.get("published_at"))
-        category = categorize_job(title)
-
-        jobs.append({
-            "id": job_id,
-            "title": title,
-            "company": company,
-            "location": location,
-            "url": url,
-            "category": category,
-            "source": "Remotive",
-            "published": published,
-        })
-
-    print(f"Remotive: Fetched {len(jobs)} jobs")
+    remember_validators("Remotive", response, jobs)
+    logger.debug("Remotive: Fetched %d jobs", len(jobs))
     return jobs
 
 
-def fetch_adzuna_jobs() -> List[Dict[str, Any]]:
+def _make_adzuna_job(item: Dict[str, Any]) -> Optional[Job]:
+    """Normalize one Adzuna result, or return None if it is incomplete."""
+    company_obj = item.get("company", {})
+    location_obj = item.get("location", {})
+    title = _clean(item.get("title"))
+    company = _clean(company_obj.get("display_name"), company_obj.get("name"))
+    location = _clean(location_obj.get("display_name"), (location_obj.get("area") or [""])[0], default="Remote")
+    url = _clean(item.get("redirect_url"), item.get("url"))
+
+    if not title or not company or not url:
+        return None
+
+    return _build_job(title, company, location, url, "Adzuna", item.get("created"))
+
+
+def fetch_adzuna_jobs() -> List[Job]:
     """
     Fetch jobs from the Adzuna API using free API credentials.
 
@@ -215,44 +551,46 @@ def fetch_adzuna_jobs() -> List[Dict[str, Any]]:
     }
 
     try:
-        response = requests.get(url, params=params, timeout=10)
+        response = SESSION.get(url, params=params, timeout=10)
         response.raise_for_status()
     except Exception as e:
-        print(f"  Adzuna API error: {str(e)[:100]}")
+        logger.warning("Adzuna API error: %s", str(e)[:100])
         return []
 
-    payload = response.json()
+    payload = decode_json(response)
     items = payload.get("results", []) or []
 
-    jobs: List[Dict[str, Any]] = []
-    for item in items:
-        title = (item.get("title") or "").strip()
-        company = (item.get("company", {}).get("display_name") or item.get("company", {}).get("name") or "").strip()
-        location = (item.get("location", {}).get("display_name") or item.get("location", {}).get("area", [""])[0] or "Remote").strip()
-        url = (item.get("redirect_url") or item.get("url") or "").strip()
-
-        if not title or not company or not url:
-            continue
-
-        job_id = generate_job_id(title, company, "Adzuna")
-        published = parse_iso_datetime(item.get("created"))
-        category = categorize_job(title)
-
-        jobs.append({
-            "id": job_id,
-            "title": title,
-            "company": company,
-            "location": location,
-            "url": url,
-            "category": category,
-            "source": "Adzuna",
-            "published": published,
-        })
+    jobs: List[Job] = [
+        job for item in items
+        if (job := _make_adzuna_job(item)) is not None
+    ]
 
     return jobs
 
 
-def fetch_jsearch_jobs() -> List[Dict[str, Any]]:
+def _make_jsearch_job(item: Dict[str, Any]) -> Optional[Job]:
+    """Normalize one JSearch result, or return None if it is incomplete."""
+    title = _clean(item.get("job_title"))
+    company = _clean(item.get("employer_name"))
+    location_parts = [
+        part for part in (
+            _clean(item.get("job_city")),
+            _clean(item.get("job_state")),
+            _clean(item.get("job_country")),
+        )
+        if part
+    ]
+    location = ", ".join(location_parts) if location_parts else "Remote"
+    url = _clean(item.get("job_apply_link"), item.get("job_url"))
+
+    if not title or not company or not url:
+        return None
+
+    published_raw = item.get("job_posted_at_datetime_utc") or item.get("job_posted_at")
+    return _build_job(title, company, location, url, "JSearch", published_raw)
+
+
+def fetch_jsearch_jobs() -> List[Job]:
     """
     Fetch jobs from the JSearch API via RapidAPI.
 
@@ -282,53 +620,36 @@ def fetch_jsearch_jobs() -> List[Dict[str, Any]]:
     }
 
     try:
-        response = requests.get(url, headers=headers, params=params, timeout=10)
+        response = SESSION.get(url, headers=headers, params=params, timeout=10)
         response.raise_for_status()
     except Exception:
         return []
 
-    payload = response.json()
+    payload = decode_json(response)
     items = payload.get("data", []) or []
 
-    jobs: List[Dict[str, Any]] = []
-    for item in items:
-        title = (item.get("job_title") or "").strip()
-        company = (item.get("employer_name") or "").strip()
-        location_parts = []
-        if item.get("job_city"):
-            location_parts.append(item.get("job_city"))
-        if item.get("job_state"):
-            location_parts.append(item.get("job_state"))
-        if item.get("job_country"):
-            location_parts.append(item.get("job_country"))
-        location = ", ".join(location_parts) if location_parts else "Remote"
-        location = location.strip()
-        url = (item.get("job_apply_link") or item.get("job_url") or "").strip()
-
-        if not title or not company or not url:
-            continue
-
-        job_id = generate_job_id(title, company, "JSearch")
-        published = parse_iso_datetime(
-            item.get("job_posted_at_datetime_utc") or item.get("job_posted_at")
-        )
-        category = categorize_job(title)
-
-        jobs.append({
-            "id": job_id,
-            "title": title,
-            "company": company,
-            "location": location,
-            "url": url,
-            "category": category,
-            "source": "JSearch",
-            "published": published,
-        })
+    jobs: List[Job] = [
+        job for item in items
+        if (job := _make_jsearch_job(item)) is not None
+    ]
 
     return jobs
 
 
-def fetch_careerjet_jobs() -> List[Dict[str, Any]]:
+def _make_careerjet_job(item: Dict[str, Any]) -> Optional[Job]:
+    """Normalize one Careerjet result, or return None if it is incomplete."""
+    title = _clean(item.get("title"))
+    company = _clean(item.get("company"))
+    location = _clean(item.get("locations"), item.get("location"), default="Remote")
+    url = _clean(item.get("url"), item.get("site"))
+
+    if not title or not company or not url:
+        return None
+
+    return _build_job(title, company, location, url, "Careerjet", item.get("date"))
+
+
+def fetch_careerjet_jobs() -> List[Job]:
     """
     Fetch jobs from the Careerjet API.
 
@@ -358,44 +679,39 @@ def fetch_careerjet_jobs() -> List[Dict[str, Any]]:
         params["location"] = location
 
     try:
-        response = requests.get(url, params=params, timeout=10)
+        response = SESSION.get(url, params=params, timeout=10)
         response.raise_for_status()
     except Exception as e:
-        print(f"  Adzuna API error: {str(e)[:100]}")
+        logger.warning("Careerjet API error: %s", str(e)[:100])
         return []
 
-    payload = response.json()
+    payload = decode_json(response)
     items = payload.get("jobs", []) or []
 
-    jobs: List[Dict[str, Any]] = []
-    for item in items:
-        title = (item.get("title") or "").strip()
-        company = (item.get("company") or "").strip()
-        location = (item.get("locations") or item.get("location") or "Remote").strip()
-        url = (item.get("url") or item.get("site") or "").strip()
-
-        if not title or not company or not url:
-            continue
-
-        job_id = generate_job_id(title, company, "Careerjet")
-        published = parse_iso_datetime(item.get("date"))
-        category = categorize_job(title)
-
-        jobs.append({
-            "id": job_id,
-            "title": title,
-            "company": company,
-            "location": location,
-            "url": url,
-            "category": category,
-            "source": "Careerjet",
-            "published": published,
-        })
+    jobs: List[Job] = [
+        job for item in items
+        if (job := _make_careerjet_job(item)) is not None
+    ]
 
     return jobs
 
 
-def fetch_themuse_jobs() -> List[Dict[str, Any]]:
+def _make_themuse_job(item: Dict[str, Any]) -> Optional[Job]:
+    """Normalize one TheMuse result, or return None if it is incomplete."""
+    title = _clean(item.get("name"))
+    company_obj = item.get("company", {})
+    company = _clean(company_obj.get("name"))
+    locations = item.get("locations", [])
+    location = _clean(locations[0].get("name") if locations else None, default="Remote")
+    url = _clean(item.get("refs", {}).get("landing_page"))
+
+    if not title or not company or not url:
+        return None
+
+    return _build_job(title, company, location, url, "TheMuse", item.get("publication_date"))
+
+
+def fetch_themuse_jobs() -> List[Job]:
     """
     Fetch jobs from The Muse API.
 
@@ -418,47 +734,46 @@ def fetch_themuse_jobs() -> List[Dict[str, Any]]:
     }
 
     try:
-        response = requests.get(url, params=params, timeout=10)
+        response = SESSION.get(url, headers=conditional_headers("TheMuse"), params=params, timeout=10)
         response.raise_for_status()
     except Exception as e:
-        print(f"  Adzuna API error: {str(e)[:100]}")
+        logger.warning("TheMuse API error: %s", str(e)[:100])
         return []
 
-    payload = response.json()
+    cached = not_modified_jobs("TheMuse", response)
+    if cached is not None:
+        return cached
+
+    payload = decode_json(response)
     items = payload.get("results", []) or []
 
-    jobs: List[Dict[str, Any]] = []
-    for item in items:
-        title = (item.get("name") or "").strip()
-        company_obj = item.get("company", {})
-        company = (company_obj.get("name") or "").strip()
-        locations = item.get("locations", [])
-        location = locations[0].get("name", "Remote") if locations else "Remote"
-        location = location.strip()
-        url = (item.get("refs", {}).get("landing_page") or "").strip()
-
-        if not title or not company or not url:
-            continue
-
-        job_id = generate_job_id(title, company, "TheMuse")
-        published = parse_iso_datetime(item.get("publication_date"))
-        category = categorize_job(title)
-
-        jobs.append({
-            "id": job_id,
-            "title": title,
-            "company": company,
-            "location": location,
-            "url": url,
-            "category": category,
-            "source": "TheMuse",
-            "published": published,
-        })
+    jobs: List[Job] = [
+        job for item in items
+        if (job := _make_themuse_job(item)) is not None
+    ]
 
+    remember_validators("TheMuse", response, jobs)
     return jobs
 
 
-def fetch_usajobs() -> List[Dict[str, Any]]:
+def _make_usajobs_job(item: Dict[str, Any]) -> Optional[Job]:
+    """Normalize one USAJobs result, or return None if it is incomplete."""
+    matched_obj = item.get("MatchedObjectDescriptor", {})
+    title = _clean(matched_obj.get("PositionTitle"))
+    org_codes = matched_obj.get("OrganizationCodes", [])
+    company = _clean(org_codes[0] if org_codes else None, default="US Government")
+    position_locations = matched_obj.get("PositionLocationDisplay", [])
+    location = _clean(position_locations[0] if position_locations else None, default="Remote")
+    position_urls = matched_obj.get("PositionURI", [])
+    url = _clean(position_urls[0] if position_urls else None)
+
+    if not title or not url:
+        return None
+
+    return _build_job(title, company, location, url, "USAJobs", matched_obj.get("PublicationStartDate"))
+
+
+def fetch_usajobs() -> List[Job]:
     """
     Fetch jobs from the USAJobs API (US government jobs).
 
@@ -480,6 +795,8 @@ def fetch_usajobs() -> List[Dict[str, Any]]:
     if api_key:
         headers["Authorization-Key"] = api_key
 
+    headers.update(conditional_headers("USAJobs"))
+
     params = {
         "Keyword": "software engineer OR developer OR data scientist OR information technology",
         "ResultsPerPage": 50,
@@ -487,48 +804,26 @@ def fetch_usajobs() -> List[Dict[str, Any]]:
     }
 
     try:
-        response = requests.get(url, headers=headers, params=params, timeout=10)
+        response = SESSION.get(url, headers=headers, params=params, timeout=10)
         response.raise_for_status()
     except Exception as e:
-        print(f"  USAJobs API error: {str(e)[:100]}")
+        logger.warning("USAJobs API error: %s", str(e)[:100])
         return []
 
-    payload = response.json()
+    cached = not_modified_jobs("USAJobs", response)
+    if cached is not None:
+        return cached
+
+    payload = decode_json(response)
     search_result = payload.get("SearchResult", {})
     items = search_result.get("SearchResultItems", []) or []
 
-    jobs: List[Dict[str, Any]] = []
-    for item in items:
-        matched_obj = item.get("MatchedObjectDescriptor", {})
-        title = (matched_obj.get("PositionTitle") or "").strip()
-        org_codes = matched_obj.get("OrganizationCodes", [])
-        company = org_codes[0] if org_codes else "US Government"
-        company = company.strip()
-        position_locations = matched_obj.get("PositionLocationDisplay", [])
-        location = position_locations[0] if position_locations else "Remote"
-        location = location.strip()
-        position_urls = matched_obj.get("PositionURI", [])
-        url = position_urls[0] if position_urls else ""
-        url = url.strip()
-
-        if not title or not url:
-            continue
-
-        job_id = generate_job_id(title, company, "USAJobs")
-        published = parse_iso_datetime(matched_obj.get("PublicationStartDate"))
-        category = categorize_job(title)
-
-        jobs.append({
-            "id": job_id,
-            "title": title,
-            "company": company,
-            "location": location,
-            "url": url,
-            "category": category,
-            "source": "USAJobs",
-            "published": published,
-        })
+    jobs: List[Job] = [
+        job for item in items
+        if (job := _make_usajobs_job(item)) is not None
+    ]
 
+    remember_validators("USAJobs", response, jobs)
     return jobs
 
 
@@ -537,17 +832,50 @@ def fetch_usajobs() -> List[Dict[str, Any]]:
 # ---------------------------------------------------------------------------
 
 
-def normalize_jobs(limit: int = 50) -> List[Dict[str, Any]]:
+# Sort key for jobs without a published date (aware, so it compares with the
+# UTC datetimes produced by parse_iso_datetime)
+_MIN_DATETIME = datetime.min.replace(tzinfo=timezone.utc)
+
+# Registered providers as (fetch function, display name, hint shown when the
+# provider returns no jobs - usually because its credentials are missing)
+PROVIDERS = [
+    (fetch_remotive_jobs, "Remotive", ""),
+    (fetch_adzuna_jobs, "Adzuna", "(API keys needed)"),
+    (fetch_jsearch_jobs, "JSearch", "(RAPIDAPI_KEY needed)"),
+    (fetch_careerjet_jobs, "Careerjet", "(CAREERJET_AFFID needed)"),
+    (fetch_themuse_jobs, "TheMuse", "(THEMUSE_API_KEY needed)"),
+    (fetch_usajobs, "USAJobs", ""),
+]
+
+# Provider preference for duplicate listings; earlier providers win
+_SOURCE_RANK = {name: rank for rank, (_, name, _) in enumerate(PROVIDERS)}
+
+
+def _dedup_preference(job: Job) -> Tuple[int, datetime]:
+    """
+    Rank duplicate copies of a listing: the copy from the earlier provider in
+    PROVIDERS wins, and within one provider a newer (or any) date wins.
+    """
+    return -_SOURCE_RANK.get(job.source, len(_SOURCE_RANK)), job.published_dt or _MIN_DATETIME
+
+
+# Long-lived pool for the provider fan-out. Fetches are blocking I/O on the
+# shared SESSION, so one worker per provider lets them all run at once, and
+# keeping the pool around avoids spawning fresh threads on every refresh.
+_FETCH_EXECUTOR = ThreadPoolExecutor(max_workers=len(PROVIDERS), thread_name_prefix="fetch")
+
+
+def normalize_jobs(limit: int = 50) -> List[Job]:
     """
     Fetch jobs from all configured APIs and normalize them into a unified stream.
 
     This is the core aggregation function that:
-    1. Calls all fetch functions in parallel (conceptually - sequential for simplicity)
+    1. Calls all fetch functions in parallel on a thread pool
     2. Merges all job lists from different APIs
     3. Removes duplicates based on (title + company) matching
     4. Categorizes jobs using keyword logic
     5. Sorts by published date (newest first)
-    6. Limits final list to specified number of jobs
+    6. Limits final list to specified number of jobs (selected with a heap)
 
     Why normalization is needed:
     - Different APIs return data in different structures
@@ -557,65 +885,388 @@ def normalize_jobs(limit: int = 50) -> List[Dict[str, Any]]:
 
     How heterogeneous APIs are unified:
     - Each fetch function maps its API's response to the STANDARD INTERNAL JOB FORMAT
-    - All jobs are converted to dictionaries with identical field names
+    - All jobs are converted to Job records with identical field names
     - Deduplication ensures we don't show the same job twice
     - Categorization provides consistent labels regardless of source
     """
-    jobs: List[Dict[str, Any]] = []
-
-    # Fetch from all configured APIs
-    # Each function handles its own authentication and error handling
-    remotive_jobs = fetch_remotive_jobs()
-    jobs.extend(remotive_jobs)
-    print(f"✓ Remotive: {len(remotive_jobs)} jobs")
-    
-    adzuna_jobs = fetch_adzuna_jobs()
-    jobs.extend(adzuna_jobs)
-    print(f"{'✓' if adzuna_jobs else '✗'} Adzuna: {len(adzuna_jobs)} jobs {'(API keys needed)' if not adzuna_jobs else ''}")
-    
-    jsearch_jobs = fetch_jsearch_jobs()
-    jobs.extend(jsearch_jobs)
-    print(f"{'✓' if jsearch_jobs else '✗'} JSearch: {len(jsearch_jobs)} jobs {'(RAPIDAPI_KEY needed)' if not jsearch_jobs else ''}")
-    
-    careerjet_jobs = fetch_careerjet_jobs()
-    jobs.extend(careerjet_jobs)
-    print(f"{'✓' if careerjet_jobs else '✗'} Careerjet: {len(careerjet_jobs)} jobs {'(CAREERJET_AFFID needed)' if not careerjet_jobs else ''}")
-    
-    themuse_jobs = fetch_themuse_jobs()
-    jobs.extend(themuse_jobs)
-    print(f"{'✓' if themuse_jobs else '✗'} TheMuse: {len(themuse_jobs)} jobs {'(THEMUSE_API_KEY needed)' if not themuse_jobs else ''}")
-    
-    usajobs_jobs = fetch_usajobs()
-    jobs.extend(usajobs_jobs)
-    print(f"{'✓' if usajobs_jobs else '✗'} USAJobs: {len(usajobs_jobs)} jobs")
+    jobs: List[Job] = []
+
+    # Fetch from all configured APIs concurrently
+    # Each function handles its own authentication and error handling, and the
+    # work is network-bound, so total latency is that of the slowest provider
+    # Results are collected in PROVIDERS order (not completion order) so the
+    # merged list, and therefore dedup, doesn't depend on network timing
+    futures = {_FETCH_EXECUTOR.submit(fetch): (name, hint) for fetch, name, hint in PROVIDERS}
+    for future, (name, hint) in futures.items():
+        try:
+            provider_jobs = future.result() or []
+        except Exception as e:
+            logger.warning("%s fetch error: %s", name, str(e)[:100])
+            provider_jobs = []
+        jobs.extend(provider_jobs)
+        if provider_jobs:
+            logger.info("✓ %s: %d jobs", name, len(provider_jobs))
+        elif hint:
+            # Usually just a provider without credentials, so keep it out of
+            # production logs
+            logger.debug("✗ %s: 0 jobs %s", name, hint)
+        else:
+            # Keyless providers should always return something
+            logger.info("✗ %s: 0 jobs", name)
 
     # Deduplicate: same title + company = same job
-    # This prevents showing duplicate listings from different APIs
-    seen = set()
-    unique_jobs: List[Dict[str, Any]] = []
+    # This prevents showing duplicate listings from different APIs. The key is
+    # precomputed by each fetch function from its already-stripped fields.
+    # Of several copies we keep the preferred one (see _dedup_preference)
+    # rather than whichever happens to come first in the merged list
+    best: Dict[Tuple[str, str], Job] = {}
     for job in jobs:
-        # Use title and company as the deduplication key
-        key = (job["title"].lower().strip(), job["company"].lower().strip())
-        if key in seen:
-            continue
-        seen.add(key)
-        unique_jobs.append(job)
-
-    # Sort by published date (newest first)
-    # Jobs without dates fall to the bottom
-    def sort_key(job: Dict[str, Any]) -> datetime:
-        published = job.get("published", "")
-        if not published:
-            return datetime.min
+        current = best.get(job.dedup_key)
+        if current is None or _dedup_preference(job) > _dedup_preference(current):
+            best[job.dedup_key] = job
+    unique_jobs: List[Job] = list(best.values())
+
+    # Sort by published date (newest first) using the datetime parsed at
+    # ingestion. Jobs without dates fall to the bottom
+    def sort_key(job: Job) -> datetime:
+        return job.published_dt or _MIN_DATETIME
+
+    # Only the newest `limit` jobs are needed, so select them with a bounded
+    # heap instead of sorting everything (same order as a full sort)
+    return heapq.nlargest(limit, unique_jobs, key=sort_key)
+
+
+# ---------------------------------------------------------------------------
+# Aggregation Cache
+# ---------------------------------------------------------------------------
+#
+# Job listings change on the scale of minutes, so the aggregated stream is
+# cached in memory instead of hitting every provider on every page load:
+# - Fresh (younger than JOBS_CACHE_TTL): served straight from memory
+# - Stale (younger than JOBS_CACHE_STALE_MAX): served immediately while a
+#   background thread refreshes the snapshot
+# - Expired or empty: the request waits for a refresh
+#
+# Only one refresh runs at a time; concurrent requests wait on the same
+# in-flight future. If a refresh fails or comes back empty, the last good
+# snapshot is kept and served as-is for JOBS_CACHE_RETRY_AFTER seconds, so an
+# upstream outage doesn't trigger a refresh on every request. Later retries
+# run in the background; requests only wait when there is no data at all.
+
+JOBS_LIMIT = 50
+JOBS_CACHE_TTL = float(os.getenv("JOBS_CACHE_TTL", "60"))
+JOBS_CACHE_STALE_MAX = float(os.getenv("JOBS_CACHE_STALE_MAX", "300"))
+JOBS_CACHE_RETRY_AFTER = float(os.getenv("JOBS_CACHE_RETRY_AFTER", "30"))
+
+_CACHE: Dict[str, Any] = {
+    "ts": 0.0,
+    "data": [],
+    "retry_after": 0.0,
+    "lock": threading.Lock(),
+    "inflight": None,
+}
+
+
+def _refresh_jobs_cache(future: Future) -> None:
+    """
+    Rebuild the cached job snapshot and resolve the in-flight future.
+
+    Keeps the previous snapshot when aggregation raises or yields nothing,
+    and holds off further refreshes for JOBS_CACHE_RETRY_AFTER seconds.
+    """
+    try:
+        jobs = normalize_jobs(limit=JOBS_LIMIT)
+    except Exception as e:
+        logger.exception("Job cache refresh error: %s", e)
+        jobs = []
+
+    with _CACHE["lock"]:
+        now = time.monotonic()
+        if jobs or not _CACHE["data"]:
+            _CACHE["data"] = jobs
+            _CACHE["ts"] = now
+            _CACHE["retry_after"] = 0.0
+        else:
+            _CACHE["retry_after"] = now + JOBS_CACHE_RETRY_AFTER
+        _CACHE["inflight"] = None
+        data = _CACHE["data"]
+
+    future.set_result(data)
+
+
+def _get_local_jobs() -> List[Job]:
+    """
+    Return the aggregated job stream from the in-process cache.
+    """
+    with _CACHE["lock"]:
+        now = time.monotonic()
+        has_data = _CACHE["ts"] > 0
+        age = now - _CACHE["ts"]
+        data = _CACHE["data"]
+        retry_after = _CACHE["retry_after"]
+
+        # Fresh, or backing off after a failed refresh
+        if has_data and (age < JOBS_CACHE_TTL or now < retry_after):
+            return data
+
+        # After a failed refresh the old snapshot is all a blocking refresh
+        # could return anyway, so retry in the background even past STALE_MAX
+        stale_ok = has_data and (age < JOBS_CACHE_STALE_MAX or retry_after > 0)
+        future = _CACHE["inflight"]
+        owner = future is None
+        if owner:
+            future = Future()
+            _CACHE["inflight"] = future
+
+    if owner:
+        if stale_ok:
+            threading.Thread(target=_refresh_jobs_cache, args=(future,), daemon=True).start()
+        else:
+            _refresh_jobs_cache(future)
+
+    if stale_ok:
+        return data
+
+    return future.result()
+
+
+# ---------------------------------------------------------------------------
+# Shared (Redis) Aggregation Cache
+# ---------------------------------------------------------------------------
+#
+# Under a multi-worker server each process would otherwise keep and refresh
+# its own copy of the cache, multiplying upstream API calls by the number of
+# workers. When REDIS_URL is set, the snapshot lives in Redis instead, with
+# the same fresh/stale windows:
+# - REDIS_JOBS_KEY holds the encoded jobs
+# - REDIS_FRESH_KEY holds the unix time until which they are fresh; it also
+#   identifies the snapshot, so each worker only decodes a new one once
+# - REDIS_LOCK_KEY (SET NX with a timeout) lets a single worker refresh; it
+#   holds a random token so a worker whose lock already expired can't
+#   release a lock another worker has since taken
+# - REDIS_RETRY_KEY is set for JOBS_CACHE_RETRY_AFTER seconds after a failed
+#   or empty refresh; no worker starts another refresh while it exists
+#
+# Both data keys expire after JOBS_CACHE_TTL + JOBS_CACHE_STALE_MAX. A failed
+# refresh extends them again, so the last good snapshot outlives an upstream
+# outage. Should Redis still lose it, each worker keeps serving the snapshot
+# it last decoded. If Redis is unreachable, the in-process cache above is
+# used instead. Redis calls use
+# short socket timeouts, and after an error Redis is skipped for
+# REDIS_RETRY_AFTER seconds so a dead server doesn't slow every request.
+
+REDIS_URL = os.getenv("REDIS_URL")
+REDIS_JOBS_KEY = "agg:jobs:v1"
+REDIS_FRESH_KEY = "agg:jobs:v1:fresh_until"
+REDIS_LOCK_KEY = "agg:jobs:v1:refreshing"
+REDIS_RETRY_KEY = "agg:jobs:v1:retry_after"
+REDIS_LOCK_TIMEOUT = 60
+REDIS_WAIT_TIMEOUT = 30.0
+REDIS_SOCKET_TIMEOUT = 1.0
+REDIS_RETRY_AFTER = 30.0
+
+_REDIS = (
+    redis.Redis.from_url(
+        REDIS_URL,
+        socket_connect_timeout=REDIS_SOCKET_TIMEOUT,
+        socket_timeout=REDIS_SOCKET_TIMEOUT,
+    )
+    if REDIS_URL and redis is not None
+    else None
+)
+
+# Circuit breaker: monotonic time before which Redis is not tried again
+_REDIS_STATE: Dict[str, float] = {"down_until": 0.0}
+
+# Deletes the refresh lock only if it still holds the caller's token
+_RELEASE_LOCK_SCRIPT = (
+    _REDIS.register_script(
+        'if redis.call("get", KEYS[1]) == ARGV[1] then '
+        'return redis.call("del", KEYS[1]) end '
+        "return 0"
+    )
+    if _REDIS is not None
+    else None
+)
+
+# Last snapshot decoded from Redis, as (fresh_until value, jobs)
+_SHARED_CACHE: Dict[str, Any] = {"entry": None}
+
+
+def _encode_jobs(jobs: List[Job]) -> bytes:
+    """Serialize jobs in the standard dictionary format."""
+    records = [job.to_dict() for job in jobs]
+    if orjson is not None:
+        return orjson.dumps(records)
+    return json.dumps(records).encode()
+
+
+def _decode_jobs(payload: bytes) -> List[Job]:
+    """Rebuild Job records from _encode_jobs output."""
+    records = orjson.loads(payload) if orjson is not None else json.loads(payload)
+    return [Job(**record) for record in records]
+
+
+def _acquire_refresh_lock() -> Optional[str]:
+    """Take REDIS_LOCK_KEY, returning its token, or None if it is held."""
+    token = secrets.token_hex(16)
+    if _REDIS.set(REDIS_LOCK_KEY, token, nx=True, ex=REDIS_LOCK_TIMEOUT):
+        return token
+    return None
+
+
+def _release_refresh_lock(token: str) -> None:
+    """Release REDIS_LOCK_KEY if it is still held with the given token."""
+    _RELEASE_LOCK_SCRIPT(keys=[REDIS_LOCK_KEY], args=[token])
+
+
+def _refresh_shared_jobs(token: str) -> List[Job]:
+    """
+    Rebuild the shared snapshot in Redis and release the refresh lock.
+
+    Must only be called by the worker holding REDIS_LOCK_KEY with token.
+    When aggregation raises or yields nothing, the previous snapshot is kept
+    (and its expiry extended) and refreshes are held off via REDIS_RETRY_KEY.
+    """
+    try:
+        try:
+            jobs = normalize_jobs(limit=JOBS_LIMIT)
+        except Exception as e:
+            logger.exception("Job cache refresh error: %s", e)
+            jobs = []
+
+        expire = int(JOBS_CACHE_TTL + JOBS_CACHE_STALE_MAX)
+        pipe = _REDIS.pipeline()
+        if jobs:
+            fresh_until = repr(time.time() + JOBS_CACHE_TTL).encode()
+            pipe.set(REDIS_JOBS_KEY, _encode_jobs(jobs), ex=expire)
+            pipe.set(REDIS_FRESH_KEY, fresh_until, ex=expire)
+            pipe.delete(REDIS_RETRY_KEY)
+            pipe.execute()
+            _SHARED_CACHE["entry"] = (fresh_until, jobs)
+        else:
+            pipe.set(REDIS_RETRY_KEY, b"1", ex=max(1, int(JOBS_CACHE_RETRY_AFTER)))
+            pipe.expire(REDIS_JOBS_KEY, expire)
+            pipe.expire(REDIS_FRESH_KEY, expire)
+            pipe.execute()
+        return jobs
+    finally:
+        _release_refresh_lock(token)
+
+
+def _refresh_shared_jobs_in_background(token: str) -> None:
+    """Thread target for stale refreshes; logs instead of raising."""
+    try:
+        _refresh_shared_jobs(token)
+    except Exception as e:
+        logger.warning("Shared job cache refresh error: %s", e)
+
+
+def _start_shared_refresh() -> None:
+    """
+    Refresh the shared snapshot in the background, unless a recent refresh
+    failed or another worker is already refreshing.
+    """
+    if _REDIS.exists(REDIS_RETRY_KEY):
+        return
+
+    token = _acquire_refresh_lock()
+    if token is not None:
+        threading.Thread(
+            target=_refresh_shared_jobs_in_background, args=(token,), daemon=True
+        ).start()
+
+
+def _load_shared_jobs(fresh_until: bytes) -> Optional[List[Job]]:
+    """
+    Return the Redis snapshot identified by fresh_until, decoding it only if
+    this worker hasn't already.
+    """
+    entry = _SHARED_CACHE["entry"]
+    if entry is not None and entry[0] == fresh_until:
+        return entry[1]
+
+    payload = _REDIS.get(REDIS_JOBS_KEY)
+    if payload is None:
+        return None
+
+    jobs = _decode_jobs(payload)
+    _SHARED_CACHE["entry"] = (fresh_until, jobs)
+    return jobs
+
+
+def _get_shared_jobs() -> List[Job]:
+    """
+    Return the aggregated job stream from Redis, refreshing it when needed.
+    """
+    deadline = time.monotonic() + REDIS_WAIT_TIMEOUT
+
+    while True:
+        fresh_until = _REDIS.get(REDIS_FRESH_KEY)
+        jobs = _load_shared_jobs(fresh_until) if fresh_until is not None else None
+
+        if jobs is not None:
+            if time.time() >= float(fresh_until):
+                _start_shared_refresh()
+            return jobs
+
+        # Redis lost the snapshot (e.g. it expired during a long outage or was
+        # evicted): keep serving the one this worker last decoded
+        entry = _SHARED_CACHE["entry"]
+        if entry is not None:
+            _start_shared_refresh()
+            return entry[1]
+
+        # Nothing cached anywhere and the last refresh failed: don't wait
+        if _REDIS.exists(REDIS_RETRY_KEY):
+            return []
+
+        # Nothing cached: refresh if no other worker is, otherwise wait for it
+        token = _acquire_refresh_lock()
+        if token is not None:
+            return _refresh_shared_jobs(token)
+
+        if time.monotonic() >= deadline:
+            logger.warning("Timed out waiting for shared job cache, using local cache")
+            return _get_local_jobs()
+
+        time.sleep(0.25)
+
+
+def get_cached_jobs() -> List[Job]:
+    """
+    Return the aggregated job stream, refreshing the cache when needed.
+
+    Uses the shared Redis cache when REDIS_URL is configured and falls back
+    to the in-process cache otherwise.
+    """
+    if _REDIS is not None and time.monotonic() >= _REDIS_STATE["down_until"]:
         try:
-            return datetime.fromisoformat(published.replace("Z", "+00:00"))
-        except Exception:
-            return datetime.min
+            return _get_shared_jobs()
+        except redis.RedisError as e:
+            _REDIS_STATE["down_until"] = time.monotonic() + REDIS_RETRY_AFTER
+            logger.warning("Redis cache error, using local cache for %ds: %s", REDIS_RETRY_AFTER, e)
+
+    return _get_local_jobs()
+
 
-    unique_jobs.sort(key=sort_key, reverse=True)
+# Rendered index page for the current cache generation, as (jobs, html). The
+# aggregation cache swaps in a new list on every refresh, so the identity of
+# the jobs list identifies the generation the HTML was rendered from.
+_RENDER_CACHE: Dict[str, Any] = {"entry": None}
 
-    # Limit to requested number of jobs
-    return unique_jobs[:limit]
+
+def render_jobs_page(jobs: List[Job]) -> str:
+    """
+    Return the index page HTML for a job snapshot, rendering it only once.
+    """
+    entry = _RENDER_CACHE["entry"]
+    if entry is not None and entry[0] is jobs:
+        return entry[1]
+
+    html = render_template("index.html", jobs=jobs)
+    _RENDER_CACHE["entry"] = (jobs, html)
+    return html
 
 
 # ---------------------------------------------------------------------------
@@ -628,27 +1279,20 @@ def index():
     """
     Main job discovery page.
 
-    We intentionally fetch fresh jobs on every request so that users always
-    see a current snapshot without needing background workers or a database.
-
-    The template expects jobs with category_slug, so we add that field here
-    for compatibility with the existing frontend.
+    Jobs come from the in-memory aggregation cache, so users see a snapshot
+    that is at most a minute or so old without needing background workers or
+    a database, and page loads don't wait on the providers. The rendered page
+    is cached alongside the snapshot, so cache hits skip templating too.
     """
     try:
-        jobs = normalize_jobs(limit=50)
-        
-        # Add category_slug for template compatibility
-        for job in jobs:
-            job["category_slug"] = slug_for_category(job["category"])
+        jobs = get_cached_jobs()
         
-        # Debug: print number of jobs fetched
-        print(f"Fetched {len(jobs)} jobs")
+        # Debug: log number of jobs served
+        logger.debug("Fetched %d jobs", len(jobs))
         
-        return render_template("index.html", jobs=jobs)
+        return Response(render_jobs_page(jobs), mimetype="text/html")
     except Exception as e:
-        print(f"Error in index route: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error in index route: %s", e)
         return render_template("index.html", jobs=[])
 
 
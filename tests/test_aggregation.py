@@ -0,0 +1,67 @@
+import logging
+import time
+import unittest
+from unittest import mock
+
+import app
+
+
+def _job(title, source="Remotive", published=None, company="Acme"):
+    return app._build_job(title, company, "Remote", "https://example.com", source, published)
+
+
+class NormalizeJobsTests(unittest.TestCase):
+    def _normalize(self, providers, limit=50):
+        with mock.patch.object(app, "PROVIDERS", providers):
+            return app.normalize_jobs(limit=limit)
+
+    def test_duplicate_keeps_preferred_provider_copy(self):
+        usajobs = [_job("Python Developer", "USAJobs", "2024-05-02T00:00:00Z")]
+        remotive = [
+            _job("python developer", "Remotive", "2024-04-01T00:00:00Z"),
+            _job("Python Developer", "Remotive", "2024-04-03T00:00:00Z"),
+        ]
+        jobs = self._normalize([
+            (lambda: usajobs, "USAJobs", ""),
+            (lambda: remotive, "Remotive", ""),
+        ])
+
+        # Remotive ranks above USAJobs even though USAJobs has the newer
+        # copy and comes first here; among Remotive's copies the newer wins
+        self.assertEqual(len(jobs), 1)
+        self.assertIs(jobs[0], remotive[1])
+
+    def test_undated_copy_loses_to_dated_copy_from_same_provider(self):
+        remotive = [_job("Designer"), _job("Designer", published="2024-04-01T00:00:00Z")]
+        jobs = self._normalize([(lambda: remotive, "Remotive", "")])
+
+        self.assertEqual(len(jobs), 1)
+        self.assertIs(jobs[0], remotive[1])
+
+    def test_results_merge_in_provider_order(self):
+        def slow():
+            time.sleep(0.05)
+            return [_job("Slow", company="A")]
+
+        jobs = self._normalize([
+            (slow, "Remotive", ""),
+            (lambda: [_job("Fast", company="B")], "USAJobs", ""),
+        ])
+
+        # Both are undated, so the stable top-N keeps the merged order even
+        # though the second provider finished first
+        self.assertEqual([job.title for job in jobs], ["Slow", "Fast"])
+
+    def test_empty_keyless_provider_is_logged_at_info(self):
+        with self.assertLogs(app.logger, logging.DEBUG) as logs:
+            self._normalize([
+                (lambda: [], "Remotive", ""),
+                (lambda: [], "Adzuna", "(API keys needed)"),
+            ])
+
+        self.assertIn("INFO:aggregator:✗ Remotive: 0 jobs", logs.output)
+        self.assertIn("DEBUG:aggregator:✗ Adzuna: 0 jobs (API keys needed)", logs.output)
+
+
+if __name__ == "__main__":
+    unittest.main()
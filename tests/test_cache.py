@@ -0,0 +1,115 @@
+import threading
+import time
+import unittest
+from unittest import mock
+
+import app
+
+
+def _job(title, source="Remotive", published=None):
+    return app._build_job(title, "Acme", "Remote", "https://example.com", source, published)
+
+
+class LocalCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.now = 1000.0
+        clock = mock.patch.object(app.time, "monotonic", side_effect=lambda: self.now)
+        clock.start()
+        self.addCleanup(clock.stop)
+
+        self.results = [[_job("First")]]
+        self.calls = 0
+
+        def fake_normalize_jobs(limit=50):
+            self.calls += 1
+            return self.results.pop(0) if self.results else []
+
+        stub = mock.patch.object(app, "normalize_jobs", side_effect=fake_normalize_jobs)
+        stub.start()
+        self.addCleanup(stub.stop)
+
+        app._CACHE.update(ts=0.0, data=[], retry_after=0.0, inflight=None)
+        self.addCleanup(app._CACHE.update, ts=0.0, data=[], retry_after=0.0, inflight=None)
+
+    def _wait_for_refresh(self):
+        deadline = time.time() + 2
+        while app._CACHE["inflight"] is not None and time.time() < deadline:
+            time.sleep(0.01)
+
+    def _titles(self, jobs):
+        return [job.title for job in jobs]
+
+    def test_miss_then_fresh_hit(self):
+        self.assertEqual(self._titles(app._get_local_jobs()), ["First"])
+        self.now += app.JOBS_CACHE_TTL - 1
+        self.assertEqual(self._titles(app._get_local_jobs()), ["First"])
+        self.assertEqual(self.calls, 1)
+
+    def test_stale_serves_old_data_and_refreshes_in_background(self):
+        app._get_local_jobs()
+        self.results = [[_job("Second")]]
+        self.now += app.JOBS_CACHE_TTL + 1
+
+        self.assertEqual(self._titles(app._get_local_jobs()), ["First"])
+        self._wait_for_refresh()
+        self.assertEqual(self._titles(app._get_local_jobs()), ["Second"])
+        self.assertEqual(self.calls, 2)
+
+    def test_expired_blocks_on_refresh(self):
+        app._get_local_jobs()
+        self.results = [[_job("Second")]]
+        self.now += app.JOBS_CACHE_STALE_MAX + 1
+
+        self.assertEqual(self._titles(app._get_local_jobs()), ["Second"])
+        self.assertEqual(self.calls, 2)
+
+    def test_failed_refresh_keeps_snapshot_and_backs_off(self):
+        app._get_local_jobs()
+        self.now += app.JOBS_CACHE_STALE_MAX + 1
+
+        # The refresh comes back empty, so the old snapshot is kept
+        self.assertEqual(self._titles(app._get_local_jobs()), ["First"])
+        self.assertEqual(self.calls, 2)
+
+        # No further refreshes while backing off
+        for _ in range(3):
+            self.assertEqual(self._titles(app._get_local_jobs()), ["First"])
+        self.assertEqual(self.calls, 2)
+
+        # After the backoff the retry runs in the background
+        self.results = [[_job("Second")]]
+        self.now += app.JOBS_CACHE_RETRY_AFTER + 1
+        self.assertEqual(self._titles(app._get_local_jobs()), ["First"])
+        self._wait_for_refresh()
+        self.assertEqual(self._titles(app._get_local_jobs()), ["Second"])
+        self.assertEqual(self.calls, 3)
+
+    def test_concurrent_misses_share_one_refresh(self):
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow_normalize_jobs(limit=50):
+            self.calls += 1
+            started.set()
+            release.wait(2)
+            return [_job("First")]
+
+        app.normalize_jobs.side_effect = slow_normalize_jobs
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(app._get_local_jobs()))
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        started.wait(2)
+        release.set()
+        for thread in threads:
+            thread.join(2)
+
+        self.assertEqual(self.calls, 1)
+        self.assertEqual([self._titles(jobs) for jobs in results], [["First"]] * 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,28 @@
+import unittest
+
+import app
+
+
+class CategorizeJobTests(unittest.TestCase):
+    def test_priority(self):
+        self.assertEqual(app.categorize_job("Data Science Intern"), "Internship")
+        self.assertEqual(app.categorize_job("Machine Learning Intern"), "Internship")
+        self.assertEqual(app.categorize_job("ML Data Engineer"), "Data Science")
+        self.assertEqual(app.categorize_job("Senior Machine-Learning Engineer"), "AI/ML")
+        self.assertEqual(app.categorize_job("Backend Engineer (AI)"), "AI/ML")
+
+    def test_whole_words_only(self):
+        self.assertEqual(app.categorize_job("Detail-oriented HTML Developer"), "Software Engineering")
+        self.assertEqual(app.categorize_job("Internal Tools Engineer"), "Software Engineering")
+
+    def test_compound_keywords(self):
+        self.assertEqual(app.categorize_job("MLOps Engineer"), "AI/ML")
+        self.assertEqual(app.categorize_job("GenAI Platform Engineer"), "AI/ML")
+        self.assertEqual(app.categorize_job("LLM Researcher"), "AI/ML")
+        self.assertEqual(app.categorize_job("NLP Scientist"), "AI/ML")
+        self.assertEqual(app.categorize_job("Database Administrator"), "Data Science")
+        self.assertEqual(app.categorize_job("Senior Databases Engineer"), "Data Science")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,53 @@
+import unittest
+from datetime import datetime, timezone
+
+import app
+
+
+def _reference_parse(value):
+    """The fromisoformat-only behaviour parse_iso_datetime must preserve."""
+    if not value:
+        return "", None
+    try:
+        dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except Exception:
+        return "", None
+    iso = dt.isoformat()
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return iso, dt
+
+
+class ParseIsoDatetimeTests(unittest.TestCase):
+    def test_matches_fromisoformat(self):
+        values = [
+            "2024-01-02T03:04:05",
+            "2024-01-02T03:04:05Z",
+            "2024-01-02T03:04:05+00:00",
+            "2024-01-02T03:04:05+05:30",
+            "2024-01-02T03:04:05.123Z",
+            "2024-01-02",
+            "2024-02-30T00:00:00",
+            "2024-13-02T03:04:05Z",
+            "2024-01-02T 3:04:05Z",
+            " 024-01-02T03:04:05Z",
+            "2024-+1-02T03:04:05",
+            "2024-01-02T03:04:0x",
+            "not a date",
+        ]
+        for value in values:
+            with self.subTest(value=value):
+                self.assertEqual(app.parse_iso_datetime(value), _reference_parse(value))
+
+    def test_empty_values(self):
+        self.assertEqual(app.parse_iso_datetime(""), ("", None))
+        self.assertEqual(app.parse_iso_datetime(None), ("", None))
+
+    def test_naive_values_keep_naive_string_but_aware_datetime(self):
+        iso, dt = app.parse_iso_datetime("2024-01-02T03:04:05")
+        self.assertEqual(iso, "2024-01-02T03:04:05")
+        self.assertEqual(dt.tzinfo, timezone.utc)
+
+
+if __name__ == "__main__":
+    unittest.main()
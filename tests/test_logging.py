@@ -0,0 +1,61 @@
+import logging
+import unittest
+from unittest import mock
+
+import app
+
+
+class _Collector(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+
+class ProcessQueueHandlerTests(unittest.TestCase):
+    def setUp(self):
+        self.target = _Collector()
+        self.handler = app._ProcessQueueHandler(self.target)
+        self.log = logging.getLogger("aggregator.tests")
+        self.log.propagate = False
+        self.log.addHandler(self.handler)
+        self.addCleanup(self.log.removeHandler, self.handler)
+
+    def _flush(self):
+        listener = self.handler.listener
+        listener.stop()
+        # Leave it restartable for the atexit hook registered by the handler
+        listener.start()
+
+    def test_listener_starts_on_first_record(self):
+        self.assertIsNone(self.handler.listener)
+        self.log.warning("first")
+        self._flush()
+        self.assertEqual(self.target.messages, ["first"])
+
+    def test_forked_process_gets_its_own_listener(self):
+        self.log.warning("parent")
+        parent_listener = self.handler.listener
+
+        with mock.patch.object(app.os, "getpid", return_value=-1):
+            self.log.warning("child")
+
+        self.assertIsNot(self.handler.listener, parent_listener)
+        self._flush()
+        self.assertIn("child", self.target.messages)
+
+
+class ResolveLogLevelTests(unittest.TestCase):
+    def test_known_names(self):
+        self.assertEqual(app._resolve_log_level("debug"), logging.DEBUG)
+        self.assertEqual(app._resolve_log_level(" WARNING "), logging.WARNING)
+
+    def test_unknown_name_falls_back_to_info(self):
+        with self.assertLogs(app.logger, logging.WARNING):
+            self.assertEqual(app._resolve_log_level("verbose"), logging.INFO)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,124 @@
+import io
+import unittest
+from unittest import mock
+
+import app
+
+
+class CleanTests(unittest.TestCase):
+    def test_first_non_blank_value_is_stripped(self):
+        self.assertEqual(app._clean(None, "", "  ", " Acme ", "Other"), "Acme")
+
+    def test_default_when_all_blank(self):
+        self.assertEqual(app._clean(None, " \t"), "")
+        self.assertEqual(app._clean(None, "", default="Remote"), "Remote")
+
+
+class MakeJobTests(unittest.TestCase):
+    def test_remotive_falls_back_to_alternate_fields(self):
+        job = app._make_remotive_job({
+            "title": " Dev ", "company": "Acme", "job_url": "u",
+            "published_at": "2024-05-01T12:00:00Z",
+        })
+        self.assertEqual((job.title, job.company, job.location, job.url), ("Dev", "Acme", "Remote", "u"))
+        self.assertEqual(job.published, "2024-05-01T12:00:00+00:00")
+        self.assertIsNone(app._make_remotive_job("not a dict"))
+
+    def test_adzuna_falls_back_to_area_and_name(self):
+        job = app._make_adzuna_job({
+            "title": "Dev", "company": {"name": "Acme"},
+            "location": {"area": ["UK", "London"]}, "url": "u",
+        })
+        self.assertEqual((job.company, job.location, job.url), ("Acme", "UK", "u"))
+
+    def test_jsearch_joins_location_parts(self):
+        item = {"job_title": "Dev", "employer_name": "Acme", "job_url": "u", "job_city": " Austin ", "job_country": "US"}
+        self.assertEqual(app._make_jsearch_job(item).location, "Austin, US")
+        del item["job_city"], item["job_country"]
+        self.assertEqual(app._make_jsearch_job(item).location, "Remote")
+
+    def test_careerjet_falls_back_to_location_and_site(self):
+        job = app._make_careerjet_job({"title": "Dev", "company": "Acme", "location": "Berlin", "site": "s"})
+        self.assertEqual((job.location, job.url), ("Berlin", "s"))
+
+    def test_themuse_defaults_to_remote(self):
+        job = app._make_themuse_job({
+            "name": "Dev", "company": {"name": "Acme"}, "locations": [], "refs": {"landing_page": "u"},
+        })
+        self.assertEqual(job.location, "Remote")
+
+    def test_usajobs_defaults_company(self):
+        job = app._make_usajobs_job({"MatchedObjectDescriptor": {"PositionTitle": "Analyst", "PositionURI": ["u"]}})
+        self.assertEqual((job.company, job.location), ("US Government", "Remote"))
+
+    def test_incomplete_items_are_skipped(self):
+        self.assertIsNone(app._make_remotive_job({"title": "Dev", "company_name": " ", "url": "u"}))
+        self.assertIsNone(app._make_adzuna_job({"title": "Dev", "company": {"name": "Acme"}}))
+        self.assertIsNone(app._make_jsearch_job({"job_title": "", "employer_name": "Acme", "job_url": "u"}))
+        self.assertIsNone(app._make_careerjet_job({"title": "Dev", "url": "u"}))
+        self.assertIsNone(app._make_themuse_job({"name": "Dev", "company": {"name": "Acme"}}))
+        self.assertIsNone(app._make_usajobs_job({"MatchedObjectDescriptor": {"PositionTitle": "Analyst"}}))
+
+
+class ConditionalRequestTests(unittest.TestCase):
+    def setUp(self):
+        app._PROVIDER_CACHE_META.clear()
+        self.addCleanup(app._PROVIDER_CACHE_META.clear)
+
+    def _response(self, status, headers, body=b'{"jobs": []}'):
+        response = mock.Mock(status_code=status, headers=headers, content=body)
+        response.json.return_value = {"jobs": [{"title": "Dev", "company_name": "Acme", "url": "u"}]}
+        return response
+
+    @mock.patch.object(app, "ijson", None)
+    def test_not_modified_reuses_previous_jobs(self):
+        full = self._response(200, {"ETag": '"v1"'})
+        not_modified = self._response(304, {})
+        with mock.patch.object(app, "orjson", None), \
+                mock.patch.object(app.SESSION, "get", side_effect=[full, not_modified]) as get:
+            first = app.fetch_remotive_jobs()
+            second = app.fetch_remotive_jobs()
+
+        self.assertEqual(get.call_args_list[0].kwargs["headers"], {})
+        self.assertEqual(get.call_args_list[1].kwargs["headers"], {"If-None-Match": '"v1"'})
+        self.assertEqual(len(first), 1)
+        self.assertIs(second, first)
+
+
+@unittest.skipIf(app.ijson is None, "ijson not installed")
+class RemotiveStreamingTests(unittest.TestCase):
+    def setUp(self):
+        app._PROVIDER_CACHE_META.clear()
+        self.addCleanup(app._PROVIDER_CACHE_META.clear)
+
+    def _fetch(self, body):
+        response = mock.Mock(status_code=200, headers={}, raw=io.BytesIO(body))
+        with mock.patch.object(app.SESSION, "get", return_value=response):
+            return app.fetch_remotive_jobs(), response
+
+    def test_streams_jobs_array(self):
+        body = (
+            b'{"job-count": 2, "jobs": ['
+            b'{"title": " Dev ", "company_name": "Acme", "url": "u1"},'
+            b'{"title": "No company", "url": "u2"},'
+            b'{"title": "Ops", "company_name": "Beta", "url": "u3"}]}'
+        )
+        jobs, response = self._fetch(body)
+
+        self.assertEqual([job.title for job in jobs], ["Dev", "Ops"])
+        response.close.assert_called_once()
+
+    def test_top_level_list_yields_no_jobs(self):
+        jobs, _ = self._fetch(b'[{"title": "Dev", "company_name": "Acme", "url": "u"}]')
+        self.assertEqual(jobs, [])
+
+    def test_truncated_stream_returns_nothing_and_closes(self):
+        jobs, response = self._fetch(b'{"jobs": [{"title": "Dev", "company_name": "Acme", "url": "u"}, {"ti')
+
+        self.assertEqual(jobs, [])
+        response.close.assert_called_once()
+        self.assertNotIn("Remotive", app._PROVIDER_CACHE_META)
+
+
+if __name__ == "__main__":
+    unittest.main()
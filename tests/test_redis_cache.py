@@ -0,0 +1,188 @@
+import time
+import unittest
+from unittest import mock
+
+import app
+
+
+def _job(title):
+    return app._build_job(title, "Acme", "Remote", "https://example.com", "Remotive", None)
+
+
+class FakeRedis:
+    """Just enough of the redis client for the shared cache (no real expiry)."""
+
+    def __init__(self):
+        self.data = {}
+        self.expiry = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def set(self, key, value, nx=False, ex=None):
+        if nx and key in self.data:
+            return None
+        self.data[key] = value.encode() if isinstance(value, str) else value
+        self.expiry[key] = ex
+        return True
+
+    def exists(self, key):
+        return int(key in self.data)
+
+    def delete(self, key):
+        return int(self.data.pop(key, None) is not None)
+
+    def expire(self, key, seconds):
+        if key not in self.data:
+            return False
+        self.expiry[key] = seconds
+        return True
+
+    def pipeline(self):
+        return FakePipeline(self)
+
+    def register_script(self, source):
+        def release(keys, args):
+            if self.data.get(keys[0]) == args[0].encode():
+                return self.delete(keys[0])
+            return 0
+        return release
+
+
+class FakePipeline:
+    def __init__(self, client):
+        self.client = client
+        self.calls = []
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: self.calls.append((name, args, kwargs))
+
+    def execute(self):
+        return [getattr(self.client, name)(*args, **kwargs) for name, args, kwargs in self.calls]
+
+
+class SharedCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.redis = FakeRedis()
+        for name, value in (
+            ("_REDIS", self.redis),
+            ("_RELEASE_LOCK_SCRIPT", self.redis.register_script("")),
+            ("_SHARED_CACHE", {"entry": None}),
+            ("_REDIS_STATE", {"down_until": 0.0}),
+        ):
+            patcher = mock.patch.object(app, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        self.results = [[_job("First")]]
+        self.calls = 0
+
+        def fake_normalize_jobs(limit=50):
+            self.calls += 1
+            return self.results.pop(0) if self.results else []
+
+        stub = mock.patch.object(app, "normalize_jobs", side_effect=fake_normalize_jobs)
+        stub.start()
+        self.addCleanup(stub.stop)
+
+    def _titles(self, jobs):
+        return [job.title for job in jobs]
+
+    def _make_stale(self):
+        self.redis.data[app.REDIS_FRESH_KEY] = repr(time.time() - 1).encode()
+
+    def _wait_for_refresh(self):
+        deadline = time.time() + 2
+        while app.REDIS_LOCK_KEY in self.redis.data and time.time() < deadline:
+            time.sleep(0.01)
+
+    def test_cold_miss_refreshes_and_stores_snapshot(self):
+        self.assertEqual(self._titles(app.get_cached_jobs()), ["First"])
+        self.assertEqual(self.calls, 1)
+        self.assertIn(app.REDIS_JOBS_KEY, self.redis.data)
+        self.assertNotIn(app.REDIS_LOCK_KEY, self.redis.data)
+
+    def test_fresh_snapshot_is_decoded_once_per_worker(self):
+        app.get_cached_jobs()
+        app._SHARED_CACHE["entry"] = None  # as seen by another worker
+
+        with mock.patch.object(app, "_decode_jobs", wraps=app._decode_jobs) as decode:
+            first = app.get_cached_jobs()
+            second = app.get_cached_jobs()
+
+        self.assertEqual(decode.call_count, 1)
+        self.assertIs(first, second)
+        self.assertEqual(self.calls, 1)
+
+    def test_stale_serves_snapshot_and_refreshes_in_background(self):
+        app.get_cached_jobs()
+        self.results = [[_job("Second")]]
+        self._make_stale()
+
+        self.assertEqual(self._titles(app.get_cached_jobs()), ["First"])
+        self._wait_for_refresh()
+        self.assertEqual(self._titles(app.get_cached_jobs()), ["Second"])
+        self.assertEqual(self.calls, 2)
+
+    def test_cold_miss_with_held_lock_waits_for_other_worker(self):
+        self.redis.set(app.REDIS_LOCK_KEY, "other-worker")
+
+        def other_worker_publishes(seconds):
+            self.redis.set(app.REDIS_JOBS_KEY, app._encode_jobs([_job("Theirs")]))
+            self.redis.set(app.REDIS_FRESH_KEY, repr(time.time() + 60).encode())
+
+        with mock.patch.object(app.time, "sleep", side_effect=other_worker_publishes):
+            self.assertEqual(self._titles(app.get_cached_jobs()), ["Theirs"])
+        self.assertEqual(self.calls, 0)
+
+    def test_cold_miss_with_held_lock_times_out_to_local_cache(self):
+        self.redis.set(app.REDIS_LOCK_KEY, "other-worker")
+
+        with mock.patch.object(app, "REDIS_WAIT_TIMEOUT", 0), \
+                mock.patch.object(app, "_get_local_jobs", return_value=["local"]):
+            self.assertEqual(app.get_cached_jobs(), ["local"])
+        self.assertEqual(self.redis.get(app.REDIS_LOCK_KEY), b"other-worker")
+
+    def test_failed_refresh_keeps_snapshot_and_backs_off(self):
+        app.get_cached_jobs()
+        self._make_stale()
+
+        self.assertEqual(self._titles(app.get_cached_jobs()), ["First"])
+        self._wait_for_refresh()
+        self.assertEqual(self.calls, 2)
+        self.assertIn(app.REDIS_RETRY_KEY, self.redis.data)
+        expire = int(app.JOBS_CACHE_TTL + app.JOBS_CACHE_STALE_MAX)
+        self.assertEqual(self.redis.expiry[app.REDIS_JOBS_KEY], expire)
+
+        # No further refreshes while the retry key exists
+        for _ in range(3):
+            self.assertEqual(self._titles(app.get_cached_jobs()), ["First"])
+        self.assertEqual(self.calls, 2)
+
+    def test_lost_snapshot_is_served_from_worker_copy(self):
+        app.get_cached_jobs()
+        self.redis.delete(app.REDIS_JOBS_KEY)
+        self.redis.delete(app.REDIS_FRESH_KEY)
+
+        self.assertEqual(self._titles(app.get_cached_jobs()), ["First"])
+        self._wait_for_refresh()
+
+    def test_failed_cold_refresh_does_not_block_other_requests(self):
+        self.results = [[]]
+        self.assertEqual(app.get_cached_jobs(), [])
+        self.assertEqual(app.get_cached_jobs(), [])
+        self.assertEqual(self.calls, 1)
+
+    @unittest.skipIf(app.redis is None, "redis package not installed")
+    def test_redis_error_falls_back_to_local_cache_and_opens_circuit(self):
+        with mock.patch.object(self.redis, "get", side_effect=app.redis.ConnectionError("down")) as get, \
+                mock.patch.object(app, "_get_local_jobs", return_value=["local"]):
+            self.assertEqual(app.get_cached_jobs(), ["local"])
+            self.assertEqual(app.get_cached_jobs(), ["local"])
+
+        self.assertEqual(get.call_count, 1)
+        self.assertGreater(app._REDIS_STATE["down_until"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
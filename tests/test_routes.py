@@ -0,0 +1,47 @@
+import unittest
+from unittest import mock
+
+import app
+
+
+def _job(title):
+    return app._build_job(title, "Acme", "Remote", "https://example.com", "Remotive", None)
+
+
+class IndexRenderCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.client = app.app.test_client()
+        self.snapshot = [_job("First")]
+
+        patcher = mock.patch.object(app, "get_cached_jobs", side_effect=lambda: self.snapshot)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        app._RENDER_CACHE["entry"] = None
+        self.addCleanup(app._RENDER_CACHE.update, entry=None)
+
+    def test_same_snapshot_renders_once(self):
+        with mock.patch.object(app, "render_template", wraps=app.render_template) as render:
+            first = self.client.get("/")
+            second = self.client.get("/")
+
+        self.assertEqual(render.call_count, 1)
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(first.data, second.data)
+        self.assertIn(b"First", first.data)
+
+    def test_new_snapshot_invalidates_page(self):
+        self.client.get("/")
+        # A refresh publishes a new list, which must be rendered again
+        self.snapshot = [_job("Second")]
+
+        with mock.patch.object(app, "render_template", wraps=app.render_template) as render:
+            response = self.client.get("/")
+
+        self.assertEqual(render.call_count, 1)
+        self.assertIn(b"Second", response.data)
+        self.assertNotIn(b"First", response.data)
+
+
+if __name__ == "__main__":
+    unittest.main()